@@ -8,9 +8,10 @@ from __future__ import annotations
 
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import yaml
 from ultralytics import YOLO
@@ -49,6 +50,13 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--cache", action="store_true", help="Cache images to RAM/disk for faster epochs.")
     parser.add_argument("--cos-lr", action="store_true", dest="cos_lr")
     parser.add_argument("--clean-broken", action="store_true", help="Drop unreadable images before training.")
+    parser.add_argument(
+        "--clean-workers",
+        type=int,
+        default=None,
+        dest="clean_workers",
+        help="Threads used by --clean-broken (default: cores allocated to this job, else --workers).",
+    )
     parser.add_argument("--exist-ok", action="store_true", dest="exist_ok", help="Overwrite an existing run.")
     parser.add_argument("--resume", action="store_true", help="Resume the most recent matching run.")
     parser.add_argument("--mosaic", type=float, default=1.0, help="Mosaic probability (0 disables).")
@@ -83,25 +91,46 @@ def load_dataset_splits(config_path: Path) -> Dict[str, Path]:
     return {k: v for k, v in splits.items() if v is not None}
 
 
-def clean_corrupt_images(image_dirs: Iterable[Path]) -> None:
+def available_cpus(fallback: int) -> int:
+    """Cores granted to this process (respects SLURM cpusets on Great Lakes)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return fallback
+
+
+def _is_corrupt(img_path: Path) -> Tuple[Path, bool]:
+    try:
+        with Image.open(img_path) as img:
+            img.verify()
+    except Exception:
+        return img_path, True
+    return img_path, False
+
+
+def clean_corrupt_images(image_dirs: Iterable[Path], workers: Optional[int] = None) -> None:
     exts = {".jpg", ".jpeg", ".png", ".bmp"}
-    removed = 0
+    candidates: List[Path] = []
     for img_dir in image_dirs:
         if not img_dir.exists():
             continue
-        for img_path in img_dir.rglob("*"):
-            if img_path.suffix.lower() not in exts:
+        candidates.extend(p for p in img_dir.rglob("*") if p.suffix.lower() in exts)
+    if not candidates:
+        return
+
+    # Verification is independent per file and mostly file I/O, so overlap it with
+    # threads; worker processes would each re-import torch via this module.
+    threads = max(1, min(workers or 1, len(candidates)))
+    removed = 0
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for img_path, corrupt in pool.map(_is_corrupt, candidates):
+            if not corrupt:
                 continue
             try:
-                with Image.open(img_path) as img:
-                    img.verify()
-            except Exception:
-                try:
-                    img_path.unlink()
-                except FileNotFoundError:
-                    pass
-                else:
-                    removed += 1
+                img_path.unlink()
+            except FileNotFoundError:
+                pass
+            else:
+                removed += 1
     if removed:
         print(f"Removed {removed} corrupt image(s).")
 
@@ -120,7 +149,9 @@ def main() -> None:
 
     splits = load_dataset_splits(data_config_path)
     if args.clean_broken:
-        clean_corrupt_images(splits.values())
+        clean_corrupt_images(
+            splits.values(), workers=args.clean_workers or available_cpus(args.workers)
+        )
 
     project_dir.mkdir(parents=True, exist_ok=True)
     run_name = args.name or datetime.now().strftime("finance-parser-%Y%m%d_%H%M%S")
@@ -1,6 +1,5 @@
 # Fine tuning script
 # --- Data integrity check ---
-import glob
 import os
 from pathlib import Path
 
@@ -15,8 +14,8 @@ DATASET_ROOT = Path(
 )
 image_dir = DATASET_ROOT / "training" / "images"
 
-for f in glob.glob(str(image_dir / "*.jpg")):
-    img = cv2.imread(f)
+for f in sorted(image_dir.glob("*.jpg")):
+    img = cv2.imread(str(f))
     if img is None:
         print(f"Removing unreadable: {f}")
         os.remove(f)
@@ -7,6 +7,7 @@ import argparse
 import csv
 import sys
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Iterable, Tuple
 
@@ -27,6 +28,12 @@ def parse_args() -> argparse.Namespace:
         default="labels",
         help="Subdirectory name containing label .txt files (default: labels).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Threads used to read label files (default: 8).",
+    )
     parser.add_argument(
         "--csv",
         action="store_true",
@@ -61,21 +68,33 @@ def load_config(path: Path) -> Tuple[Dict[str, str], Dict[int, str]]:
     return {k: v for k, v in splits.items() if v}, names
 
 
-def count_labels(labels_dir: Path) -> Counter:
+def count_file(label_file: Path) -> Counter:
+    counter: Counter = Counter()
+    try:
+        with label_file.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                class_id = int(line.split()[0])
+                counter[class_id] += 1
+    except Exception as exc:  # pragma: no cover - best-effort stats
+        print(f"[warn] Skipping {label_file}: {exc}", file=sys.stderr)
+    return counter
+
+
+def count_labels(labels_dir: Path, workers: int = 8) -> Counter:
     counter: Counter = Counter()
     if not labels_dir.exists():
         return counter
-    for label_file in labels_dir.rglob("*.txt"):
-        try:
-            with label_file.open("r", encoding="utf-8") as fh:
-                for line in fh:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    class_id = int(line.split()[0])
-                    counter[class_id] += 1
-        except Exception as exc:  # pragma: no cover - best-effort stats
-            print(f"[warn] Skipping {label_file}: {exc}", file=sys.stderr)
+    label_files = list(labels_dir.rglob("*.txt"))
+    if not label_files:
+        return counter
+    # Label files are tiny and independent; overlapping the reads hides per-file
+    # latency on network mounts such as Great Lakes scratch.
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(label_files)))) as pool:
+        for file_counts in pool.map(count_file, label_files):
+            counter.update(file_counts)
     return counter
 
 
@@ -113,7 +132,7 @@ def main() -> None:
         labels_dir = split_path
         if labels_dir.name != args.labels_subdir:
             labels_dir = labels_dir / args.labels_subdir
-        counter = count_labels(labels_dir)
+        counter = count_labels(labels_dir, workers=args.workers)
         all_results[split_name] = counter
 
     if args.csv:
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import math
 from statistics import NormalDist
 from typing import Dict
@@ -25,6 +26,7 @@ def parse_class_boxes(raw: str) -> Dict[str, float]:
     return entries
 
 
+@functools.lru_cache(maxsize=32)
 def z_score(confidence: float) -> float:
     """Return the z-score for a (0,1) confidence level."""
     if not 0 < confidence < 1:
@@ -6,16 +6,15 @@ from __future__ import annotations
 import argparse
 import csv
 import sys
+from collections import deque
 from pathlib import Path
 from typing import Dict, List, Optional
 
 
 def read_last_row(csv_path: Path) -> Dict[str, str]:
-    rows: List[Dict[str, str]] = []
     with csv_path.open("r", encoding="utf-8") as fh:
-        reader = csv.DictReader(fh)
-        rows = list(reader)
-    return rows[-1] if rows else {}
+        last = deque(csv.DictReader(fh), maxlen=1)
+    return last[0] if last else {}
 
 
 def summarize_run(run_dir: Path) -> Dict[str, Optional[str]]:
@@ -3,7 +3,7 @@ from __future__ import annotations
 import io
 import os
 from pathlib import Path
-from typing import List, Tuple
+from typing import Tuple
 
 import pandas as pd
 import streamlit as st
@@ -21,9 +21,9 @@ DEFAULT_MODEL_PATH = (
 ALLOWED_TYPES = ("jpg", "jpeg", "png")
 
 
-@st.cache_resource(show_spinner=False)
-def load_model(weights_path: Path) -> YOLO:
-    """Load YOLO weights once per Streamlit session."""
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_model(weights_path: Path, weights_mtime: float) -> YOLO:
+    """Load YOLO weights once per weights file version (mtime is part of the key)."""
     return YOLO(str(weights_path))
 
 
@@ -44,24 +44,19 @@ def _format_detections(result) -> pd.DataFrame:
         return pd.DataFrame(columns=["label", "confidence", "x1", "y1", "x2", "y2"])
 
     xyxy = boxes.xyxy.cpu().numpy()
-    conf = boxes.conf.cpu().numpy()
-    cls_ids = boxes.cls.cpu().numpy()
+    cls_ids = pd.Series(boxes.cls.cpu().numpy().astype(int))
     names = result.names or {}
 
-    rows: List[dict] = []
-    for coords, confidence, cls_id in zip(xyxy, conf, cls_ids):
-        rows.append(
-            {
-                "label": names.get(int(cls_id), f"class_{int(cls_id)}"),
-                "confidence": float(confidence),
-                "x1": float(coords[0]),
-                "y1": float(coords[1]),
-                "x2": float(coords[2]),
-                "y2": float(coords[3]),
-            }
-        )
-
-    df = pd.DataFrame.from_records(rows)
+    df = pd.DataFrame(
+        {
+            "label": cls_ids.map(names).fillna("class_" + cls_ids.astype(str)),
+            "confidence": boxes.conf.cpu().numpy(),
+            "x1": xyxy[:, 0],
+            "y1": xyxy[:, 1],
+            "x2": xyxy[:, 2],
+            "y2": xyxy[:, 3],
+        }
+    )
     return df.sort_values("confidence", ascending=False).reset_index(drop=True)
 
 
@@ -73,10 +68,9 @@ def _annotate_umich(image: Image.Image, detections: pd.DataFrame) -> Image.Image
     draw = ImageDraw.Draw(annotated)
     font = _load_font()
 
-    for _, row in detections.iterrows():
-        box = (row["x1"], row["y1"], row["x2"], row["y2"])
-        label = row["label"]
-        conf = row["confidence"]
+    columns = detections[["label", "confidence", "x1", "y1", "x2", "y2"]]
+    for label, conf, x1, y1, x2, y2 in columns.itertuples(index=False, name=None):
+        box = (x1, y1, x2, y2)
         text = f"{label} {conf:.2f}"
 
         draw.rectangle(box, outline=UM_BLUE, width=4)
@@ -97,8 +91,10 @@ def _annotate_umich(image: Image.Image, detections: pd.DataFrame) -> Image.Image
     return annotated
 
 
-def _run_inference(image: Image.Image, confidence: float, iou: float) -> Tuple[Image.Image, pd.DataFrame]:
-    model = load_model(DEFAULT_MODEL_PATH)
+def _run_inference(
+    image: Image.Image, confidence: float, iou: float, weights_mtime: float
+) -> Tuple[Image.Image, pd.DataFrame]:
+    model = load_model(DEFAULT_MODEL_PATH, weights_mtime)
     result = model.predict(image, conf=confidence, iou=iou, verbose=False)[0]
     detections = _format_detections(result)
     annotated = _annotate_umich(image, detections)
@@ -109,6 +105,17 @@ def _bytes_to_image(data: bytes) -> Image.Image:
     return Image.open(io.BytesIO(data)).convert("RGB")
 
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_inference(
+    data: bytes, confidence: float, iou: float, weights_mtime: float
+) -> Tuple[bytes, pd.DataFrame]:
+    """Score an upload once per image/threshold/weights combination."""
+    annotated, detections = _run_inference(_bytes_to_image(data), confidence, iou, weights_mtime)
+    buffer = io.BytesIO()
+    annotated.save(buffer, format="JPEG")
+    return buffer.getvalue(), detections
+
+
 def main() -> None:
     st.set_page_config(page_title="Financial Form Text Extractor", layout="wide")
     st.title("Financial Form Text Extractor")
@@ -136,25 +143,23 @@ def main() -> None:
         st.info("Waiting for uploads… drag a JPG/PNG into the widget above to begin.")
         return
 
+    weights_mtime = DEFAULT_MODEL_PATH.stat().st_mtime
     for uploaded in uploads:
         st.markdown(f"### {uploaded.name}")
-        raw_image = _bytes_to_image(uploaded.getvalue())
+        raw_bytes = uploaded.getvalue()
 
-        st.image(raw_image, caption="Original", use_container_width=True)
+        st.image(raw_bytes, caption="Original", use_container_width=True)
         with st.spinner("Running YOLOv8 inference…"):
-            annotated, detections = _run_inference(raw_image, confidence, iou)
+            annotated_bytes, detections = _cached_inference(raw_bytes, confidence, iou, weights_mtime)
 
         if detections.empty:
             st.warning("No bounding boxes detected with the current thresholds.")
             continue
 
-        annotated_buffer = io.BytesIO()
-        annotated.save(annotated_buffer, format="JPEG")
-
-        st.image(annotated_buffer.getvalue(), caption="UM-Branded Bounding Boxes", use_container_width=True)
+        st.image(annotated_bytes, caption="UM-Branded Bounding Boxes", use_container_width=True)
         st.download_button(
             label="Download annotated JPG",
-            data=annotated_buffer.getvalue(),
+            data=annotated_bytes,
             file_name=f"{Path(uploaded.name).stem}_umich_bboxes.jpg",
             mime="image/jpeg",
             key=f"download-{uploaded.name}",